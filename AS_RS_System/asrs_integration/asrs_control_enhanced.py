@@ -6,8 +6,10 @@ Author: Integration Service
 """
 
 import time
+import threading
 from opcua import Client, ua
 import logging
+from config import ASRS_CONFIG
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -19,10 +21,20 @@ SERVER_URL = "opc.tcp://10.10.14.104:4840"
 STORE_TAGS = {f"{l}{n}S": f"{l}{n}S" for l in "ABCDE" for n in range(1, 8)}
 RETRIEVE_TAGS = {f"{l}{n}": f"{l}{n}" for l in "ABCDE" for n in range(1, 8)}
 
+# NodeIds for every command tag, parsed once instead of on each pulse
+_TAG_NODE_IDS = {tag: ua.NodeId.from_string(f"ns=4;s={tag}") for tag in (*STORE_TAGS, *RETRIEVE_TAGS)}
+
+# Pulse values are built once and reused for every command
+_DV_TRUE = ua.DataValue(ua.Variant(True, ua.VariantType.Boolean))
+_DV_FALSE = ua.DataValue(ua.Variant(False, ua.VariantType.Boolean))
+
 class ASRSController:
     def __init__(self):
         self.client = None
         self.connected = False
+        self.closed = False
+        # Serialises pulses and reconnects with disconnect() from other threads
+        self._lock = threading.RLock()
 
     def connect(self):
         """Connect to ASRS OPC UA server"""
@@ -39,13 +51,25 @@ class ASRSController:
 
     def disconnect(self):
         """Disconnect from ASRS OPC UA server"""
-        if self.client and self.connected:
-            try:
-                self.client.disconnect()
+        with self._lock:
+            if self.client and self.connected:
                 self.connected = False
-                logger.info("🔌 Disconnected from ASRS system")
-            except Exception as e:
-                logger.error(f"Error disconnecting: {e}")
+                try:
+                    self.client.disconnect()
+                    logger.info("🔌 Disconnected from ASRS system")
+                except Exception as e:
+                    logger.error(f"Error disconnecting: {e}")
+
+    def close(self):
+        """Disconnect for good; later commands are refused instead of reconnecting"""
+        with self._lock:
+            self.closed = True
+            self.disconnect()
+
+    def reopen(self):
+        """Accept commands again after close(); connects lazily on the next one"""
+        with self._lock:
+            self.closed = False
 
     def pulse_node(self, tag_name, duration=0.1):
         """Send pulse command to ASRS node"""
@@ -53,13 +77,10 @@ class ASRSController:
             raise Exception("ASRS not connected")
 
         try:
-            node = self.client.get_node(f"ns=4;s={tag_name}")
-            variant_true = ua.DataValue(ua.Variant(True, ua.VariantType.Boolean))
-            variant_false = ua.DataValue(ua.Variant(False, ua.VariantType.Boolean))
-
-            node.set_attribute(ua.AttributeIds.Value, variant_true)
+            node = self.client.get_node(_TAG_NODE_IDS[tag_name])
+            node.set_attribute(ua.AttributeIds.Value, _DV_TRUE)
             time.sleep(duration)
-            node.set_attribute(ua.AttributeIds.Value, variant_false)
+            node.set_attribute(ua.AttributeIds.Value, _DV_FALSE)
 
             logger.info(f"📡 Sent command: {tag_name}")
             return True
@@ -100,23 +121,33 @@ class ASRSController:
         return success
 
     def execute_command(self, command_type, location):
-        """Execute store or retrieve command"""
-        if not self.connect():
-            return False
-
-        try:
-            if command_type.lower() == 'store':
-                result = self.store_item(location)
-            elif command_type.lower() == 'retrieve':
-                result = self.retrieve_item(location)
-            else:
-                raise ValueError(f"Invalid command type: {command_type}")
-
-            time.sleep(2)  # Wait for operation to complete
-            return result
-
-        finally:
-            self.disconnect()
+        """Execute store or retrieve command over a session kept open between calls"""
+        operations = {'store': self.store_item, 'retrieve': self.retrieve_item}
+        operation = operations.get(command_type.lower())
+        if operation is None:
+            raise ValueError(f"Invalid command type: {command_type}")
+
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("ASRS controller is closed")
+
+            reused = self.connected
+            if not reused and not self.connect():
+                return False
+
+            result = operation(location)
+            if not result:
+                self.disconnect()  # Session may be broken
+                # A kept-open session can go stale between commands; retry once on a fresh one
+                if reused and self.connect():
+                    logger.warning(f"🔄 Retrying {command_type} at {location} on a new session")
+                    result = operation(location)
+                    if not result:
+                        self.disconnect()
+
+        if result:
+            time.sleep(ASRS_CONFIG['operation_delay'])  # Wait for operation to complete
+        return result
 
 # Backward compatibility function for existing manual usage
 def main():
@@ -145,6 +176,8 @@ def main():
 
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        controller.disconnect()
 
 if __name__ == "__main__":
     main()
@@ -36,9 +36,5 @@ SERVICE_CONFIG = {
 # Location Mapping (for your specific ASRS layout)
 LOCATION_MAPPING = {
     # Format: 'database_location': 'asrs_command'
-    'A1': 'A1', 'A2': 'A2', 'A3': 'A3', 'A4': 'A4', 'A5': 'A5', 'A6': 'A6', 'A7': 'A7',
-    'B1': 'B1', 'B2': 'B2', 'B3': 'B3', 'B4': 'B4', 'B5': 'B5', 'B6': 'B6', 'B7': 'B7',
-    'C1': 'C1', 'C2': 'C2', 'C3': 'C3', 'C4': 'C4', 'C5': 'C5', 'C6': 'C6', 'C7': 'C7',
-    'D1': 'D1', 'D2': 'D2', 'D3': 'D3', 'D4': 'D4', 'D5': 'D5', 'D6': 'D6', 'D7': 'D7',
-    'E1': 'E1', 'E2': 'E2', 'E3': 'E3', 'E4': 'E4', 'E5': 'E5', 'E6': 'E6', 'E7': 'E7'
+    f"{row}{col}": f"{row}{col}" for row in "ABCDE" for col in range(1, 8)
 }
@@ -8,6 +8,7 @@ import sys
 import signal
 import time
 import logging
+from logging.handlers import RotatingFileHandler
 from threading import Thread
 from config import DATABASE_CONFIG, SERVICE_CONFIG
 from order_monitor import OrderMonitor
@@ -17,16 +18,17 @@ logging.basicConfig(
     level=getattr(logging, SERVICE_CONFIG['log_level']),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('asrs_integration.log'),
+        RotatingFileHandler('asrs_integration.log', maxBytes=5 * 1024 * 1024, backupCount=3),
         logging.StreamHandler(sys.stdout)
-    ]
+    ],
+    force=True  # order_monitor's imports already configured the root logger
 )
 
 logger = logging.getLogger(__name__)
 
 class ASRSIntegrationService:
     def __init__(self):
-        self.order_monitor = OrderMonitor(DATABASE_CONFIG)
+        self.order_monitor = OrderMonitor(DATABASE_CONFIG, SERVICE_CONFIG['monitor_interval'])
         self.monitor_thread = None
         self.running = False
 
@@ -6,6 +6,7 @@ Monitors database for new orders and triggers ASRS operations
 import mysql.connector
 import time
 import logging
+import threading
 from asrs_control_enhanced import ASRSController
 
 # Configure logging
@@ -13,11 +14,13 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 class OrderMonitor:
-    def __init__(self, db_config):
+    def __init__(self, db_config, monitor_interval=5):
         self.db_config = db_config
+        self.monitor_interval = monitor_interval
         self.last_checked_order_id = self.get_last_order_id()
         self.asrs = ASRSController()
         self.running = False
+        self._stop_event = threading.Event()
 
     def get_db_connection(self):
         """Get database connection"""
@@ -165,6 +168,9 @@ class OrderMonitor:
 
         success_count = 0
         for i, loc in enumerate(locations[:quantity]):
+            if not self.running:
+                logger.warning(f"⏹️ Monitor stopping; {quantity - i} item(s) of order {order_id} not retrieved")
+                break
             subcom_place = loc['subcom_place']  # e.g. "A5c"
             box_id = loc['box_id']              # e.g. "A5"
 
@@ -209,7 +215,11 @@ class OrderMonitor:
     def monitor_orders(self):
         """Main monitoring loop"""
         self.running = True
+        self._stop_event.clear()
+        self.asrs.reopen()
         logger.info("🚀 Order monitoring started...")
+        interval = self.monitor_interval
+        next_tick = time.monotonic()
         while self.running:
             try:
                 new_orders = self.get_new_orders()
@@ -219,18 +229,24 @@ class OrderMonitor:
                         oid = order['order_id']
                         orders_dict.setdefault(oid, []).append(order)
                     for oid, items in orders_dict.items():
+                        if not self.running:
+                            break  # leave unstarted orders pending for the next run
                         logger.info(f"🆕 New order detected: {oid}")
                         for item in items:
                             self.process_order(item)
                         self.last_checked_order_id = max(self.last_checked_order_id, oid)
-                time.sleep(5)
+                # Poll on a fixed schedule so query time doesn't stretch the interval
+                next_tick = max(next_tick + interval, time.monotonic())
+                self._stop_event.wait(max(0, next_tick - time.monotonic()))
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(10)
+                self._stop_event.wait(10)
 
     def stop_monitoring(self):
         """Stop the monitoring service"""
         self.running = False
+        self._stop_event.set()  # wake the loop instead of waiting out the interval
+        self.asrs.close()  # waits for an in-flight pulse, then blocks further reconnects
         logger.info("🛑 Stopping order monitoring...")
 
 if __name__ == "__main__":
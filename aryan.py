@@ -2,6 +2,7 @@
 import os
 import logging
 import asyncio
+import queue
 import threading
 import requests
 import json
@@ -24,46 +25,89 @@ ASRS_HOST = os.getenv('ASRS_HOST', '127.0.0.1')
 ASRS_PORT = int(os.getenv('ASRS_PORT', '8888'))
 BACKEND_API = f"http://localhost:{os.getenv('PORT_BACKEND', '4000')}"
 
+# The ASRS server reads one command per line, so the worker keeps a single
+# connection open instead of reconnecting for every command
+_asrs_conn = None
+
+def _close_asrs_conn():
+    global _asrs_conn
+    if _asrs_conn is not None:
+        _asrs_conn[1].close()
+        _asrs_conn = None
+
 async def send_command_to_asrs(cmd):
-    try:
-        reader, writer = await asyncio.open_connection(ASRS_HOST, ASRS_PORT)
-        logging.info(f"Sending command to ASRS: {cmd}")
-        writer.write((cmd+"\n").encode())
-        await writer.drain()
-        resp = await reader.readline()
-        writer.close()
-        await writer.wait_closed()
-        return resp.decode().strip()
-    except Exception as e:
-        logging.error(f"Error sending to ASRS: {e}")
-        return None
+    global _asrs_conn
+    for attempt in range(2):
+        reused = _asrs_conn is not None
+        try:
+            if reused:
+                # Let a close that arrived while idle reach the reader before writing
+                await asyncio.sleep(0)
+                if _asrs_conn[0].at_eof():
+                    _close_asrs_conn()
+                    reused = False
+            if not reused:
+                _asrs_conn = await asyncio.open_connection(ASRS_HOST, ASRS_PORT)
+            reader, writer = _asrs_conn
+            logging.info(f"Sending command to ASRS: {cmd}")
+            writer.write((cmd+"\n").encode())
+            await writer.drain()
+        except Exception as e:
+            _close_asrs_conn()
+            if reused and not attempt:
+                continue  # write failed on a dead socket, so the server never saw the command
+            logging.error(f"Error sending to ASRS: {e}")
+            return None
+        try:
+            resp = await reader.readline()
+            if not resp:
+                raise ConnectionError("ASRS closed the connection")
+            return resp.decode().strip()
+        except Exception as e:
+            # The server may already have pulsed the PLC; never resend once the command is out
+            _close_asrs_conn()
+            logging.error(f"Error reading ASRS reply to {cmd}: {e}")
+            return None
 
-def run_async(cmd):
-    loop = asyncio.new_event_loop()
+# Commands are fire-and-forget for the HTTP caller; a single worker drains
+# them in arrival order on one long-lived event loop
+command_queue = queue.Queue(maxsize=1024)
+
+def asrs_worker():
+    try:
+        import uvloop  # optional, not available on Windows
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
-    loop.run_until_complete(send_command_to_asrs(cmd))
-    loop.close()
+    while True:
+        cmd = command_queue.get()
+        loop.run_until_complete(send_command_to_asrs(cmd))
+        command_queue.task_done()
+
+threading.Thread(target=asrs_worker, daemon=True).start()
 
 @app.route('/backend-data', methods=['POST'])
 @limiter.limit("50/minute")
 def handle_backend_data():
     data = request.json
-    logging.debug(f"Received data: {json.dumps(data)}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Received data: %s", json.dumps(data))
     commands = []
     # Handle product_added
     if data.get('type') == 'product_added':
         loc = parse_storage_update(data['subcom_place'], data['status'])
         if loc:
             commands.append(loc.upper())
-    # Handle product_retrieved
+    # Handle product_retrieved; one pulse per box even if several items share it
     elif data.get('type') == 'product_retrieved':
         for loc in data.get('locations', []):
             loc_tag = parse_retrieval_location(loc)
-            if loc_tag:
+            if loc_tag and loc_tag.upper() not in commands:
                 commands.append(loc_tag.upper())
     # Send commands to ASRS TCP server
     for cmd in commands:
-        threading.Thread(target=run_async, args=(cmd,)).start()
+        command_queue.put(cmd)
     return jsonify({"status": "success", "processed": commands})
 
 @app.route('/health', methods=['GET'])
@@ -1,7 +1,6 @@
 from flask import Flask, request, jsonify
-from asrs_control import pulse_node, STORE_TAGS, RETRIEVE_TAGS, SERVER_URL
+from asrs_control import pulse_with_reconnect, is_session_lost, TRANSPORT_ERRORS, STORE_TAGS, RETRIEVE_TAGS
 import os
-from opcua import Client, ua
 
 app = Flask(__name__)
 
@@ -16,27 +15,24 @@ def asrs_command():
         return jsonify({'error': 'Operation and location required'}), 400
 
     if operation == 'add':
-        cmd = location + 'S'  # Store command
+        tag = STORE_TAGS.get(location + 'S')  # Store command
         action = 'Store'
     elif operation == 'retrieve':
-        cmd = location        # Retrieve command
+        tag = RETRIEVE_TAGS.get(location)     # Retrieve command
         action = 'Retrieve'
     else:
         return jsonify({'error': f"Invalid operation '{operation}'. Use 'add' or 'retrieve'."}), 400
 
-    if (operation == 'add' and cmd not in STORE_TAGS) or (operation == 'retrieve' and cmd not in RETRIEVE_TAGS):
+    if tag is None:
         return jsonify({'error': f"Invalid location '{location}'. Use A1–E7."}), 400
 
-    tag = cmd
-    client = Client(SERVER_URL)
-    client.connect()
     try:
-        pulse_node(client, tag)
+        pulse_with_reconnect(tag)
         return jsonify({'result': f"{action} at {location}"})
-    except ua.UaStatusCodeError as e:
+    except TRANSPORT_ERRORS as e:
+        if is_session_lost(e):
+            return jsonify({'error': f"ASRS connection lost: {e}"}), 503
         return jsonify({'error': f"Write failed: {e}"}), 500
-    finally:
-        client.disconnect()
 
 # ---------------------------------------------------------------------------
 # Launch on configurable, non-colliding port (default 4001)
@@ -3,6 +3,8 @@ import os
 import time
 import asyncio
 import logging
+import threading
+import concurrent.futures
 from opcua import Client, ua
 
 # Logging
@@ -13,7 +15,7 @@ logging.basicConfig(
 
 OPCUA_URL = os.getenv('OPCUA_SERVER_URL')
 # ---------------------------------------------------------------------------
-# Export SERVER_URL so that asrs_api.py can import it without crashing
+# SERVER_URL falls back to localhost so the shared client never gets None
 # ---------------------------------------------------------------------------
 SERVER_URL = OPCUA_URL or "opc.tcp://localhost:4840"
 ASRS_HOST = os.getenv('ASRS_HOST','127.0.0.1')
@@ -22,37 +24,124 @@ ASRS_PORT = int(os.getenv('ASRS_PORT','8888'))
 STORE_TAGS = {f"{l}{n}S":f"{l}{n}S" for l in "ABCDE" for n in range(1,8)}
 RETRIEVE_TAGS = {f"{l}{n}":f"{l}{n}" for l in "ABCDE" for n in range(1,8)}
 
+# NodeIds for every command tag, parsed once instead of on each pulse
+_TAG_NODE_IDS = {tag: ua.NodeId.from_string(f"ns=4;s={tag}") for tag in (*STORE_TAGS, *RETRIEVE_TAGS)}
+
+# Pulse values are immutable once built, so share them across every write
+_DV_TRUE = ua.DataValue(ua.Variant(True, ua.VariantType.Boolean))
+_DV_FALSE = ua.DataValue(ua.Variant(False, ua.VariantType.Boolean))
+
+# One OPC UA session per process; opening a session costs several round trips
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+def get_shared_client():
+    """Return the process-wide OPC UA client, connecting it on first use."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            client = Client(SERVER_URL); client.connect()
+            _shared_client = client
+        return _shared_client
+
+def close_shared_client(client=None):
+    """Drop the shared client so the next get_shared_client() reconnects."""
+    global _shared_client
+    with _shared_client_lock:
+        if client is not None and client is not _shared_client:
+            return  # already replaced by another caller
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        try:
+            client.disconnect()
+        except Exception as e:
+            logging.warning("Error closing OPC UA session: %s", e)
+
+# Status codes that mean the session or secure channel is gone, not just one bad write
+_SESSION_LOST_CODES = {
+    ua.StatusCodes.BadSessionIdInvalid,
+    ua.StatusCodes.BadSessionClosed,
+    ua.StatusCodes.BadSessionNotActivated,
+    ua.StatusCodes.BadSecureChannelIdInvalid,
+    ua.StatusCodes.BadSecureChannelClosed,
+    ua.StatusCodes.BadConnectionClosed,
+}
+
+# What python-opcua raises when the link drops mid-request: a closed socket cancels
+# pending request futures, and on Python < 3.11 futures time out with their own class
+TRANSPORT_ERRORS = (
+    OSError,
+    TimeoutError,
+    concurrent.futures.TimeoutError,
+    concurrent.futures.CancelledError,
+    ua.UaError,
+)
+
+def is_session_lost(exc):
+    """True if exc means the OPC UA session is unusable and must be reopened."""
+    if isinstance(exc, ua.UaStatusCodeError):
+        return exc.code in _SESSION_LOST_CODES
+    return isinstance(exc, TRANSPORT_ERRORS)
+
 def pulse_node(client, tag,duration=0.1):
-    node = client.get_node(f"ns=4;s={tag}")
-    for val in (True, False):
-        dv = ua.DataValue(ua.Variant(val, ua.VariantType.Boolean))
+    node = client.get_node(_TAG_NODE_IDS[tag])
+    for dv in (_DV_TRUE, _DV_FALSE):
         node.set_attribute(ua.AttributeIds.Value, dv)
         time.sleep(duration)
 
+def pulse_with_reconnect(tag):
+    """Pulse tag on the shared session, retrying once on a fresh session if it drops."""
+    for attempt in range(2):
+        client = None
+        try:
+            client = get_shared_client()
+            pulse_node(client, tag)
+            return
+        except TRANSPORT_ERRORS as e:
+            if not is_session_lost(e):
+                raise
+            if client is not None:
+                close_shared_client(client)
+            if attempt:
+                raise ConnectionError(f"OPC UA session lost: {e!r}") from e
+            logging.warning("OPC UA session lost during %s pulse (%r); retrying", tag, e)
+
 async def handle(reader, writer):
-    client=Client(OPCUA_URL); client.connect()
     addr=writer.get_extra_info('peername')
     logging.info(f"Client connected: {addr}")
     try:
         while data:=await reader.readline():
             cmd=data.decode().strip().upper()
-            logging.debug(f"Command received: {cmd}")
+            logging.debug("Command received: %s", cmd)
             if cmd in STORE_TAGS:
                 tag, action = STORE_TAGS[cmd], "Store"
             elif cmd in RETRIEVE_TAGS:
                 tag, action = RETRIEVE_TAGS[cmd], "Retrieve"
             else:
                 writer.write(f"Invalid {cmd}\n".encode()); await writer.drain(); continue
-            await asyncio.to_thread(pulse_node, client, tag)
+            try:
+                await asyncio.to_thread(pulse_with_reconnect, tag)
+            except Exception as e:
+                # Reply instead of closing so the sender can't mistake this for a stale socket and resend
+                logging.error("%s at %s failed: %s", action, tag.rstrip('S'), e)
+                writer.write(f"Error {cmd}: {e}\n".encode()); await writer.drain(); continue
             resp=f"{action} at {tag.rstrip('S')}\n"
             writer.write(resp.encode()); await writer.drain()
     finally:
-        client.disconnect(); writer.close()
+        writer.close()
 
 async def main():
     server=await asyncio.start_server(handle, ASRS_HOST, ASRS_PORT)
     logging.info(f"ASRS server on {ASRS_HOST}:{ASRS_PORT}")
-    async with server: await server.serve_forever()
+    try:
+        async with server: await server.serve_forever()
+    finally:
+        close_shared_client()
 
 if __name__=="__main__":
+    try:
+        import uvloop  # optional, not available on Windows
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -32,50 +32,23 @@ async def run_command_with_output(cmd, cwd=None, name="Service"):
         print(f"❌ Failed to start {name}: {e}")
         return None
 
-async def check_port(port, name):
-    try:
-        import socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(('127.0.0.1', port))
-        sock.close()
-        if result == 0:
-            print(f"✅ {name} - Port {port} is open")
-            return True
-        else:
-            print(f"❌ {name} - Port {port} is closed")
-            return False
-    except Exception as e:
-        print(f"❌ {name} - Error checking port {port}: {e}")
-        return False
-
 async def wait_for_service_advanced(url, name, max_attempts=20):
     print(f"Waiting for {name} at {url}...")
-    try:
-        import urllib.parse
-        parsed = urllib.parse.urlparse(url)
-        port = parsed.port or (80 if parsed.scheme == 'http' else 443)
-    except:
-        port = None
     for attempt in range(max_attempts):
         try:
-            if port:
-                if not await check_port(port, name):
-                    print(f"  Attempt {attempt+1}/{max_attempts}: Port {port} not ready")
-                    await asyncio.sleep(3)
-                    continue
-            response = requests.get(url, timeout=5)
+            # A closed port surfaces as ConnectionError, so no separate TCP probe
+            response = await asyncio.to_thread(requests.get, url, timeout=5)
             if response.status_code == 200:
                 print(f"✅ {name} is ready!")
                 return True
             else:
-                print(f"  Attempt {attempt+1}/{max_attempts}: Got status {response.status_code}")
+                print(f"  {name} attempt {attempt+1}/{max_attempts}: Got status {response.status_code}")
         except requests.exceptions.ConnectionError:
-            print(f"  Attempt {attempt+1}/{max_attempts}: Connection refused")
+            print(f"  {name} attempt {attempt+1}/{max_attempts}: Port not ready (connection refused)")
         except requests.exceptions.Timeout:
-            print(f"  Attempt {attempt+1}/{max_attempts}: Timeout")
+            print(f"  {name} attempt {attempt+1}/{max_attempts}: Timeout")
         except Exception as e:
-            print(f"  Attempt {attempt+1}/{max_attempts}: {str(e)}")
+            print(f"  {name} attempt {attempt+1}/{max_attempts}: {str(e)}")
         await asyncio.sleep(3)
     print(f"❌ {name} failed to start after {max_attempts} attempts")
     return False
@@ -90,7 +63,7 @@ async def check_processes(processes):
                 stderr = await process.stderr.read()
                 if stderr:
                     print(f"   Error output: {stderr.decode()}")
-            except:
+            except Exception:
                 pass
         else:
             print(f"❌ {name} process failed to start")
@@ -155,11 +128,11 @@ async def main():
         "Frontend": f"http://localhost:{os.getenv('PORT_FRONTEND', '3000')}"
     }
 
-    all_ready = True
-    for name, url in services.items():
-        ready = await wait_for_service_advanced(url, name)
-        if not ready:
-            all_ready = False
+    # Wait on all services at once; total time is the slowest one, not the sum
+    results = await asyncio.gather(
+        *(wait_for_service_advanced(url, name) for name, url in services.items())
+    )
+    all_ready = all(results)
 
     if all_ready:
         print("\n🎉 All services are ready!")
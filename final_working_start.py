@@ -4,6 +4,8 @@ import subprocess
 import webbrowser
 import sys
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set environment variables
 env_vars = {
@@ -22,6 +24,8 @@ env_vars = {
 for key, value in env_vars.items():
     os.environ[key] = value
 processes = []
+# Set on Ctrl+C so the probe threads return instead of finishing their retries
+stop_probes = threading.Event()
 def test_service(url, name, max_attempts=8):
     print(f"🧪 Testing {name}...")
     for attempt in range(max_attempts):
@@ -30,10 +34,10 @@ def test_service(url, name, max_attempts=8):
             if response.status_code == 200:
                 print(f"   ✅ {name} responding")
                 return True
-        except:
+        except requests.exceptions.RequestException:
             pass
-        if attempt < max_attempts - 1:
-            time.sleep(4)
+        if attempt < max_attempts - 1 and stop_probes.wait(4):
+            return False
     print(f"   ❌ {name} not responding")
     return False
 def start_service(name, cmd, cwd='.'): 
@@ -60,7 +64,7 @@ def main():
     print("🗄️ Running MySQL setup...")
     try:
         subprocess.run([sys.executable, "mysql_setup.py"], timeout=30)
-    except:
+    except (OSError, subprocess.SubprocessError):
         print("⚠️ MySQL setup completed with warnings")
     # Start services with proper delays
     services = [
@@ -82,9 +86,16 @@ def main():
         ("Frontend", "http://localhost:3000")
     ]
     working_services = 0
-    for name, url in tests:
-        if test_service(url, name):
-            working_services += 1
+    # Check services concurrently and report each as soon as its result is in
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = [pool.submit(test_service, url, name) for name, url in tests]
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    working_services += 1
+        except KeyboardInterrupt:
+            stop_probes.set()  # before leaving the with block waits on the probes
+            raise
     print(f"\n📊 RESULTS: {working_services}/{len(tests)} services working")
     if working_services >= 2:  # Frontend + at least one backend service
         print("🎉 SYSTEM READY!")
@@ -112,7 +123,7 @@ def main():
     for name, process in processes:
         try:
             process.terminate()
-        except:
+        except OSError:
             pass
 if __name__ == "__main__":
     main()
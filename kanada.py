@@ -33,8 +33,9 @@ async def main():
                 response = requests.get(url, timeout=3)
                 if response.status_code == 200:
                     return True
-            except:
-                await asyncio.sleep(2)
+            except requests.exceptions.RequestException:
+                pass
+            await asyncio.sleep(2)
         return False
 
     services = {
@@ -5,6 +5,8 @@ import webbrowser
 import sys
 import requests
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 env_vars = {
     'NODE_ENV': 'development',
@@ -18,6 +20,8 @@ env_vars = {
 for key, value in env_vars.items():
     os.environ[key] = value
 processes = []
+# Set on Ctrl+C so the probe threads return instead of finishing their retries
+stop_probes = threading.Event()
 def cleanup():
     print("\n🛑 Shutting down all services...")
     for name, process in processes:
@@ -26,10 +30,11 @@ def cleanup():
                 process.terminate()
                 process.wait(timeout=5)
                 print(f"   ✅ Stopped {name}")
-            except:
+            except (subprocess.TimeoutExpired, OSError):
                 process.kill()
                 print(f"   🔪 Killed {name}")
 def signal_handler(signum, frame):
+    stop_probes.set()
     cleanup()
     sys.exit(0)
 signal.signal(signal.SIGINT, signal_handler)
@@ -45,8 +50,8 @@ def test_service(url, name, max_attempts=10):
             pass
         except Exception as e:
             print(f"   ⚠️ {name} test error: {e}")
-        if attempt < max_attempts - 1:
-            time.sleep(3)
+        if attempt < max_attempts - 1 and stop_probes.wait(3):
+            return False
     print(f"   ❌ {name} not responding after {max_attempts} attempts")
     return False
 def start_service(name, cmd, cwd='.'): 
@@ -95,10 +100,11 @@ def main():
         ("Aryan Middleware", "http://localhost:5000/health"),
         ("Frontend UI", "http://localhost:3000")
     ]
-    all_working = True
-    for name, url in tests:
-        if not test_service(url, name):
-            all_working = False
+    # Probe all services at once so a dead one doesn't delay the others
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = [pool.submit(test_service, url, name) for name, url in tests]
+        results = [future.result() for future in futures]
+    all_working = all(results)
     print(f"\n📊 SYSTEM STATUS")
     print("-" * 30)
     if all_working:
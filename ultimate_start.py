@@ -21,7 +21,7 @@ def check_service(url, name):
             if response.status_code == 200:
                 print(f"✅ {name} is responding")
                 return True
-        except:
+        except requests.exceptions.RequestException:
             pass
         time.sleep(2)
     print(f"❌ {name} not responding")